@@ -1,21 +1,85 @@
+import functools
 import sys
 
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from matplotlib.collections import LineCollection
 
 import utils
 
 try:
-    from scipy import interpolate
+    from numba import njit
 
-    scipy_installed = True
+    numba_installed = True
 except ModuleNotFoundError:
-    scipy_installed = False
+    numba_installed = False
 
 version = "1.0.12-beta.1"
 
 
+if numba_installed:
+
+    # No fastmath here: its nnan/ninf flags compile the np.isnan checks
+    # below to always-False, and NaNs are the normal case in this
+    # matrix (ragged ticker histories, benchmark calendar gaps)
+    @njit(cache=True)
+    def _rolling_z(a, w):
+        """
+        Rolling z-score plus 100 base over window `w`, column by column
+        in a single pass with running sums. Windows containing NaN, and
+        zero-variance windows, return NaN - matching the numpy/pandas
+        paths. Compiled once per dtype and cached on disk.
+        """
+        rows, cols = a.shape
+
+        out = np.empty((rows - w + 1, cols), dtype=a.dtype)
+
+        for col in range(cols):
+            # Accumulators are float64 (numba unifies with the Python
+            # float zero) - float32 running sums drift too much
+            total = 0.0
+            total2 = 0.0
+            nan_count = 0
+
+            for row in range(rows):
+                value = a[row, col]
+
+                if np.isnan(value):
+                    nan_count += 1
+                else:
+                    total += value
+                    total2 += value * value
+
+                if row >= w:
+                    # Remove the value leaving the window
+                    old = a[row - w, col]
+
+                    if np.isnan(old):
+                        nan_count -= 1
+                    else:
+                        total -= old
+                        total2 -= old * old
+
+                if row < w - 1:
+                    continue
+
+                if nan_count:
+                    out[row - w + 1, col] = np.nan
+                else:
+                    mean = total / w
+                    var = (total2 / w - mean * mean) * (w / (w - 1))
+
+                    if var <= 0.0:
+                        # Flat closes over the window - no deviation to
+                        # normalize by
+                        out[row - w + 1, col] = np.nan
+                    else:
+                        out[row - w + 1, col] = (value - mean) / np.sqrt(var) + 100
+
+        return out
+
+
 class RRG:
     def __init__(
         self,
@@ -27,6 +91,21 @@ class RRG:
     ):
         self.watchlist = watchlist
 
+        # Watchlist entries parsed and normalized once as
+        # (ticker, display name, url) tuples
+        self.symbols = []
+
+        for i, ticker in enumerate(watchlist):
+            short_name = None
+
+            if "," in ticker:
+                ticker, short_name = ticker.split(",")
+
+            if short_name is None:
+                short_name = ticker
+
+            self.symbols.append((ticker, short_name.upper(), f"s{i}"))
+
         benchmark_config = config.get("BENCHMARK", None)
 
         if benchmark:
@@ -46,8 +125,17 @@ class RRG:
         self.base_date = config.get("BASE_DATE")
         self.config = config
 
-        # Keep track of data points, lines and text annotations
-        self.state = {}
+        # Consolidated artists, created in plot()
+        self.line_collection = None
+        self.tail_collection = None
+        self.head_collection = None
+
+        # Per ticker artist state as parallel lists, indexed in step with
+        # the collections created in plot()
+        self.urls = []
+        self.annotations = []
+        self.dates = []
+        self.dates_data = []
 
         # Keep track of the alpha state of lines and text
         self.text_alpha_state = 0
@@ -68,6 +156,10 @@ class RRG:
 
         self.loader = loader_class(config, period=self.minimum_data_length, **kwargs)
 
+        # Cache of loaded and cleaned Close series per symbol, so repeated
+        # plot() calls skip duplicate file I/O and index validation.
+        self._closes_cache = {}
+
         self.help_plt = None
 
         self.help_str = """
@@ -105,28 +197,35 @@ marker, and label
         self.highlighted_count = 0
         self.active_date_labels = []
 
+        # Cached rendering of the static chart for blitting.
+        # Captured on every full draw (initial display and resizes)
+        self._bg = None
+
     def plot(self):
         txt_alpha = 0.4
 
         # colors = np.random.rand(len(self.watchlist), 3) * 0.6
 
-        bm = self.loader.get(self.benchmark)
+        tickers = [ticker for ticker, _, _ in self.symbols]
+
+        # Benchmark and all tickers fetched in one batched loader call
+        closes_sers = self._get_closes_many([self.benchmark] + tickers)
 
-        if bm is None or bm.empty:
+        bm_closes = closes_sers[self.benchmark]
+
+        if bm_closes is None:
             raise ValueError(f"Unable to load benchmark data for {self.benchmark}")
 
-        if len(bm) < self.minimum_data_length:
+        if len(bm_closes) < self.minimum_data_length:
             raise ValueError("Benchmark data is insufficient to plot chart.")
 
-        bm_closes = self._process_ser(bm.loc[:, "Close"])
-
         # Setup the chart
         self.fig, axs = plt.subplots()
         axs.format_coord = self._format_coords
 
         plt.tight_layout()
 
-        axs.set_title(f"RRG - {self.benchmark.upper()} - {bm.index[-1]:%d %b %Y}")
+        axs.set_title(f"RRG - {self.benchmark.upper()} - {bm_closes.index[-1]:%d %b %Y}")
         axs.set_xlabel("RS Ratio")
         axs.set_ylabel("RS Momentum")
 
@@ -143,118 +242,182 @@ marker, and label
         x_max = y_max = 0
         x_min = y_min = 200
 
-        # Start calculation of RS and RS Momentum
-        for i, ticker in enumerate(self.watchlist):
-            short_name = None
+        # Assemble all Close series into a single wide DataFrame
+        # (columns are tickers), so RS and Momentum are computed in one
+        # vectorized pass instead of once per ticker.
+        closes_dct = {}
 
-            if "," in ticker:
-                ticker, short_name = ticker.split(",")
-
-            if short_name is None:
-                short_name = ticker
+        for ticker in tickers:
+            ser = closes_sers[ticker]
 
-            df = self.loader.get(ticker)
+            if ser is None:
+                continue
 
-            if df is None or df.empty:
+            # Reject short histories up-front, before they pay for the
+            # RS and Momentum computation
+            if len(ser) < self.minimum_data_length:
+                print(f"Unable to load `{ticker.upper()}`: Insufficient data")
                 continue
 
-            ser_closes = self._process_ser(df.loc[:, "Close"])
+            closes_dct[ticker] = ser
+
+        if not closes_dct:
+            raise ValueError("Unable to load data for any ticker in watchlist")
+
+        closes = pd.concat(closes_dct, axis=1)
 
-            rsr = self._calculate_rs(ser_closes, bm_closes)
+        # Align everything to the combined calendar once. From here the
+        # numeric pipeline runs on plain float32 matrices - no index
+        # alignment on every binary op. float32 is plenty for chart
+        # coordinates and halves the memory traffic.
+        index = closes.index
+        closes_vals = closes.to_numpy(np.float32)
 
-            rsm = self._calculate_momentum(rsr)
+        # Benchmark reciprocal computed once - turns the per column
+        # division and the * 100 scaling into a single multiply
+        inv_bm = (100.0 / bm_closes.reindex(index)).to_numpy(np.float32)
 
-            if min(len(rsm), len(rsr)) < self.tail_count:
+        rsr_vals = self._calculate_rs(closes_vals, inv_bm)
+
+        # Dates corresponding to the rsr_vals rows
+        rs_index = index[self.window - 1 :]
+
+        rsm_vals = self._calculate_momentum(rsr_vals, rs_index)
+
+        col_idx = {ticker: k for k, ticker in enumerate(closes.columns)}
+
+        # Collect plottable tickers first, so the smooth tail curves can
+        # be evaluated for all tickers in a single batch.
+        plot_data = []
+
+        for i, ticker in enumerate(tickers):
+            k = col_idx.get(ticker)
+
+            if k is None:
+                continue
+
+            rsr_col = rsr_vals[:, k]
+            rsm_col = rsm_vals[:, k]
+
+            # Valid row positions per column - ragged ticker histories
+            # carry NaNs from the rolling warmup
+            rsr_valid = np.flatnonzero(np.isfinite(rsr_col))
+            rsm_valid = np.flatnonzero(np.isfinite(rsm_col))
+
+            if min(len(rsr_valid), len(rsm_valid)) < self.tail_count:
                 print(f"Unable to load `{ticker.upper()}`: Insufficient data")
                 continue
 
-            rsr_line = rsr.iloc[-self.tail_count :]
-            rsm_line = rsm.iloc[-self.tail_count :]
+            tail_idx = rsr_valid[-self.tail_count :]
 
-            color = self._get_color(rsr.iloc[-1], rsm.iloc[-1])
+            plot_data.append(
+                (
+                    i,
+                    rsr_col[tail_idx],
+                    rsm_col[rsm_valid[-self.tail_count :]],
+                    rs_index[tail_idx],
+                )
+            )
 
-            if rsr_line.max() > x_max:
-                x_max = rsr_line.max()
+        tails_x = np.empty((len(plot_data), self.tail_count))
+        tails_y = np.empty((len(plot_data), self.tail_count))
 
-            if rsr_line.min() < x_min:
-                x_min = rsr_line.min()
+        for j, (_, tail_x, tail_y, _) in enumerate(plot_data):
+            tails_x[j] = tail_x
+            tails_y[j] = tail_y
 
-            if rsm_line.max() > y_max:
-                y_max = rsm_line.max()
+        if self.tail_count > 2:
+            curves = self._get_smooth_curves(tails_x, tails_y)
+        else:
+            curves = np.stack((tails_x, tails_y), axis=2)
+
+        # Axis limits from one reduction over all tails
+        if len(plot_data):
+            x_min, x_max = tails_x.min(), tails_x.max()
+            y_min, y_max = tails_y.min(), tails_y.max()
+
+        head_x = tails_x[:, -1]
+        head_y = tails_y[:, -1]
+
+        colors = self._get_colors(head_x, head_y)
+
+        self.urls = [self.symbols[i][2] for i, _, _, _ in plot_data]
+        self.annotations = []
+        self.dates = []
+        self.dates_data = []
+
+        # Consolidate artists into one collection each for tail lines,
+        # tail markers and head markers, so matplotlib draws 3 artists
+        # instead of several per ticker.
+
+        # Tail lines (Not visible by default)
+        self.line_collection = LineCollection(
+            list(curves),
+            colors=colors,
+            linestyle="-",
+            linewidths=1.2,
+            alpha=0,
+        )
+        axs.add_collection(self.line_collection)
+
+        # Tail markers (Not visible by default)
+        self.tail_collection = axs.scatter(
+            x=tails_x[:, :-1].ravel(),
+            y=tails_y[:, :-1].ravel(),
+            c=np.repeat(colors, self.tail_count - 1),
+            s=20,
+            marker="o",
+            alpha=0,
+        )
 
-            if rsm_line.min() < y_min:
-                y_min = rsm_line.min()
+        # Head markers (latest data points - Visible)
+        self.head_collection = axs.scatter(
+            x=head_x,
+            y=head_y,
+            s=40,
+            c=colors,
+            marker="o",
+            picker=True,
+        )
+        self.head_collection.set_urls(self.urls)
+
+        # Toggleable artists are excluded from the full draw (and hence
+        # the cached background) and blitted on top by _redraw
+        self.line_collection.set_animated(True)
+        self.tail_collection.set_animated(True)
+
+        # Shadow copies of the per ticker alpha state, so event handlers
+        # decide visibility from plain arrays instead of reading private
+        # Artist attributes
+        self._alpha_lines = np.zeros(len(plot_data))
+        self._alpha_markers = np.zeros(len(plot_data))
+        self._alpha_text = np.zeros(len(plot_data))
+
+        # Start plotting RS and RS Momentum
+        for j, (i, _, _, tail_dates) in enumerate(plot_data):
+            # Tail values as plain arrays - avoids repeated pandas
+            # positional and label lookups below
+            tail_x = tails_x[j]
+            tail_y = tails_y[j]
 
             annotation = axs.annotate(
-                short_name.upper(),
-                xy=(rsr.iloc[-1], rsm.iloc[-1]),
+                self.symbols[i][1],
+                xy=(tail_x[-1], tail_y[-1]),
                 xytext=(5, -3),
                 textcoords="offset points",
                 horizontalalignment="left",
                 alpha=0,
+                animated=True,
             )
 
-            # Plot the head marker (latest data point - Visible)
-            marker = axs.scatter(
-                x=rsr.iloc[-1],
-                y=rsm.iloc[-1],
-                s=40,
-                color=color,
-                marker="o",
-                picker=True,
-            )
-
-            url = f"s{i}"
-            marker.set_url(url)
-
-            # Plot the tail markers (Not visible by default)
-            markers = axs.scatter(
-                x=rsr.iloc[-self.tail_count : -1],
-                y=rsm.iloc[-self.tail_count : -1],
-                c=color,
-                s=20,
-                marker="o",
-                alpha=0,
-            )
-
-            if scipy_installed and self.tail_count > 2:
-                x, y = self._get_smooth_curve(
-                    rsr.iloc[-self.tail_count :], rsm.iloc[-self.tail_count :]
-                )
-            else:
-                x = rsr.iloc[-self.tail_count :]
-                y = rsm.iloc[-self.tail_count :]
-
-            line = axs.plot(
-                x,
-                y,
-                linestyle="-",
-                color=color,
-                linewidth=1.2,
-                alpha=0,
-            )[0]
-
-            # apply date annotations to the tail markers
-            # Head marker date text is set to bold
-            date_annotations = tuple(
-                axs.annotate(
-                    idx.strftime("%d %b %Y"),
-                    xy=(rsr.loc[idx], rsm.loc[idx]),
-                    xytext=(-5, -3),
-                    textcoords="offset points",
-                    horizontalalignment="right",
-                    alpha=0,
-                    zorder=100,
-                    fontweight=("bold" if idx == rsr.index[-1] else "normal"),
-                )
-                for idx in rsr.index[-self.tail_count :]
-            )
-
-            self.state[url] = dict(
-                line=line,
-                markers=markers,
-                annotation=annotation,
-                dates=date_annotations,
+            # Only store the data for the date annotations here. The
+            # artists are created on first reveal (see _get_date_labels),
+            # keeping hidden annotations out of the initial draw. The
+            # date strings are formatted in one vectorized strftime call
+            self.annotations.append(annotation)
+            self.dates.append(None)
+            self.dates_data.append(
+                tuple(zip(tail_dates.strftime("%d %b %Y"), tail_x, tail_y))
             )
 
         axs.set_xlim(x_min - 0.3, x_max + 0.3)
@@ -299,6 +462,7 @@ marker, and label
 
         self.fig.canvas.mpl_connect("pick_event", self._on_pick)
         self.fig.canvas.mpl_connect("key_press_event", self._on_key_press)
+        self.fig.canvas.mpl_connect("draw_event", self._on_draw)
 
         # Display the chart window in full screen
         window_manager = plt.get_current_fig_manager()
@@ -317,6 +481,25 @@ marker, and label
 
         plt.show()
 
+    def _get_closes_many(self, symbols: list) -> dict:
+        """
+        Return the cleaned Close series for symbols as a dict keyed by
+        symbol (None where data is unavailable).
+
+        Symbols not seen before are fetched in one batched loader call;
+        everything is cached across plot() invocations.
+        """
+        missing = [s for s in symbols if s not in self._closes_cache]
+
+        if missing:
+            for symbol, df in self.loader.get_many(missing).items():
+                if df is None or df.empty:
+                    self._closes_cache[symbol] = None
+                else:
+                    self._closes_cache[symbol] = self._process_ser(df.loc[:, "Close"])
+
+        return {s: self._closes_cache[s] for s in symbols}
+
     @staticmethod
     def _process_ser(ser: pd.Series) -> pd.Series:
         """
@@ -332,12 +515,129 @@ marker, and label
         return ser
 
     @staticmethod
-    def _get_smooth_curve(x, y):
-        # Interpolate a smooth curve through the scatter points
-        tck, _ = interpolate.splprep([x, y], s=0, k=2)  # s=0 for no smoothing
-        t = np.linspace(0, 1, 100)  # Parameter values
-        line_x, line_y = interpolate.splev(t, tck)  # Evaluate spline
-        return line_x, line_y
+    @functools.lru_cache
+    def _curve_basis(knot_count: int, samples: int = 100) -> np.ndarray:
+        """
+        Basis matrix of shape (samples, knot_count) for a uniform
+        Catmull-Rom spline through `knot_count` points.
+
+        The spline is linear in its control points, so evaluating it
+        reduces to one matrix multiply with this basis. Computed once
+        per knot count and cached.
+        """
+        k = knot_count
+
+        # Tangent at each knot as weights over the knots.
+        # Central difference inside, one-sided at the ends.
+        tangents = np.zeros((k, k))
+        tangents[0, :2] = -1.0, 1.0
+        tangents[-1, -2:] = -1.0, 1.0
+
+        for row in range(1, k - 1):
+            tangents[row, row - 1] = -0.5
+            tangents[row, row + 1] = 0.5
+
+        # Map each sample to a curve segment and local parameter t
+        u = np.linspace(0, k - 1, samples)
+        seg = np.minimum(u.astype(int), k - 2)
+        t = u - seg
+
+        # Cubic Hermite basis functions
+        t2 = t * t
+        t3 = t2 * t
+        h00 = 2 * t3 - 3 * t2 + 1
+        h10 = t3 - 2 * t2 + t
+        h01 = -2 * t3 + 3 * t2
+        h11 = t3 - t2
+
+        basis = np.zeros((samples, k))
+        rows = np.arange(samples)
+        basis[rows, seg] += h00
+        basis[rows, seg + 1] += h01
+        basis += h10[:, None] * tangents[seg] + h11[:, None] * tangents[seg + 1]
+
+        return basis
+
+    def _get_smooth_curves(
+        self, tails_x: np.ndarray, tails_y: np.ndarray
+    ) -> np.ndarray:
+        """
+        Interpolate smooth curves through the tail points of all tickers
+        in one batch.
+
+        `tails_x` and `tails_y` have shape (ticker_count, tail_count).
+        Returns an array of shape (ticker_count, samples, 2).
+        """
+        basis = self._curve_basis(self.tail_count)
+
+        points = np.stack((tails_x, tails_y), axis=2)
+
+        return np.einsum("sk,nkd->nsd", basis, points)
+
+    @staticmethod
+    def _rolling_mean_std(a: np.ndarray, w: int):
+        """
+        Rolling mean and standard deviation (ddof=1) over window `w`
+        along the first axis, computed with two cumulative sums in a
+        single pass instead of separate pandas rolling passes.
+
+        Windows containing NaN return NaN, matching pandas rolling
+        with min_periods equal to the window size.
+
+        Returns arrays of length `len(a) - w + 1`.
+        """
+        valid = np.isfinite(a)
+        a0 = np.where(valid, a, 0.0)
+
+        pad = np.zeros((1,) + a.shape[1:])
+
+        # Accumulate in float64 regardless of input dtype; a float32
+        # cumulative sum loses too much precision for the variance
+        csum = np.concatenate((pad, np.cumsum(a0, axis=0, dtype=np.float64)))
+        csum2 = np.concatenate((pad, np.cumsum(a0 * a0, axis=0, dtype=np.float64)))
+        count = np.concatenate((pad, np.cumsum(valid, axis=0)))
+
+        mean = (csum[w:] - csum[:-w]) / w
+        var = (csum2[w:] - csum2[:-w]) / w - mean * mean
+
+        # Clip tiny negatives from floating point cancellation and
+        # scale for ddof=1
+        var = np.maximum(var, 0.0) * (w / (w - 1))
+
+        # Mask windows missing one or more values
+        full = (count[w:] - count[:-w]) == w
+
+        mean[~full] = np.nan
+
+        std = np.sqrt(var)
+        std[~full] = np.nan
+
+        return mean.astype(a.dtype, copy=False), std.astype(a.dtype, copy=False)
+
+    @staticmethod
+    def _rolling_zscore(a: np.ndarray, w: int) -> np.ndarray:
+        """
+        Rolling z-score plus 100 base over window `w`, i.e.
+        `(a - rolling_mean) / rolling_std + 100` from row `w - 1` on.
+
+        Dispatches to the numba kernel when numba is installed - one
+        fused pass specialized for the fixed window - with the numpy
+        cumsum kernel as fallback.
+        """
+        if numba_installed:
+            return _rolling_z(a, w)
+
+        mean, std = RRG._rolling_mean_std(a, w)
+
+        # In-place sequence on one output buffer - the naive expression
+        # `(a - mean) / std + 100` would allocate a fresh full-size
+        # temporary per operator
+        out = a[w - 1 :].copy()
+        out -= mean
+        out /= std
+        out += 100
+
+        return out
 
     @staticmethod
     def _format_coords(x, y):
@@ -346,31 +646,43 @@ marker, and label
         """
         return f"RS: {x:.2f}     MOM: {y:.2f}"
 
-    @staticmethod
-    def _get_color(x, y):
-        if x > 100:
-            return "#008217" if y > 100 else "#918000"
-        else:
-            return "#00749D" if y > 100 else "#E0002B"
+    # Quadrant colors indexed by (x > 100) * 2 + (y > 100)
+    # Lagging, Improving, Weakening, Leading
+    quadrant_colors = np.array(["#E0002B", "#00749D", "#918000", "#008217"])
+
+    @classmethod
+    def _get_colors(cls, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Quadrant color for every (x, y) pair in one vectorized lookup"""
+        return cls.quadrant_colors[(x > 100) * 2 + (y > 100)]
 
-    def _calculate_rs(self, stock_df: pd.Series, benchmark_df: pd.Series) -> pd.Series:
+    def _calculate_rs(
+        self, closes: np.ndarray, inv_benchmark: np.ndarray
+    ) -> np.ndarray:
         """
         Returns the RS ratio as a multiple of standard dev of SMA(RS)
 
+        Operates on a (dates, tickers) matrix of Close values, aligned
+        by the caller. `inv_benchmark` is `100 / benchmark_closes`.
+        The `window - 1` rolling warmup rows are cut from the result.
+
         - Take the difference of RS and SMA(RS).
         - Divide the difference with the standard deviation of SMA(RS)
         - Add 100 to serve as a base value
         """
-        rs = (stock_df / benchmark_df) * 100
+        rs = closes * inv_benchmark[:, None]
 
-        rs_sma = rs.rolling(window=self.window)
+        return self._rolling_zscore(rs, self.window)
 
-        return ((rs - rs_sma.mean()) / rs_sma.std(ddof=1)).dropna() + 100
-
-    def _calculate_momentum(self, rs_ratio: pd.Series) -> pd.Series:
+    def _calculate_momentum(
+        self, rs_ratio: np.ndarray, index: pd.DatetimeIndex
+    ) -> np.ndarray:
         """
         Returns the RS momentum as a multiple of standard deviation of SMA(ROC)
 
+        Operates on a (dates, tickers) matrix of RS ratios; `index`
+        holds the dates of its rows. The `window - 1` rolling warmup
+        rows are cut from the result.
+
         - Calculate the ROC using the first value as base
         - Take the difference of ROC and SMA(ROC)
         - Divide the difference with the standard deviation of SMA(ROC)
@@ -378,16 +690,69 @@ marker, and label
         """
 
         if self.base_date:
-            base_rs = rs_ratio.at[self.base_date]
+            base_rs = rs_ratio[index.get_loc(self.base_date)]
         else:
-            base_rs = rs_ratio.iloc[-self.period]
+            base_rs = rs_ratio[-self.period]
 
         # Rate of change (ROC)
-        rs_roc = ((rs_ratio / base_rs) - 1) * 100
+        rs_roc = (rs_ratio / base_rs - 1) * 100
 
-        roc_sma = rs_roc.rolling(window=self.window)
+        return self._rolling_zscore(rs_roc, self.window)
 
-        return ((rs_roc - roc_sma.mean()) / roc_sma.std(ddof=1)).dropna() + 100
+    def _draw_artists(self):
+        """
+        Draw the toggleable (animated) artists with the current
+        renderer.
+        """
+        if self.line_collection is None:
+            return
+
+        self.axs.draw_artist(self.line_collection)
+        self.axs.draw_artist(self.tail_collection)
+
+        for j in np.flatnonzero(self._alpha_text):
+            self.axs.draw_artist(self.annotations[j])
+
+        for date_label in self.active_date_labels:
+            self.axs.draw_artist(date_label)
+
+        if self.help_plt is not None:
+            self.axs.draw_artist(self.help_plt)
+
+    def _on_draw(self, event):
+        """
+        Cache the static chart as the blitting background on every full
+        draw (initial display, resize, zoom etc).
+        """
+        self._bg = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+
+        # Animated artists are excluded from the full draw, so paint
+        # them back on top - otherwise a resize or zoom would blank the
+        # highlighted state until the next event
+        self._draw_artists()
+
+    def _redraw(self):
+        """
+        Redraw only the toggleable artists over the cached background,
+        instead of re-rendering the entire chart.
+        """
+        canvas = self.fig.canvas
+
+        if self._bg is None or not canvas.supports_blit:
+            canvas.draw_idle()
+            return
+
+        canvas.restore_region(self._bg)
+
+        self._draw_artists()
+
+        canvas.blit(self.fig.bbox)
+
+    def _set_marker_alphas(self):
+        """Expand per ticker alphas to one per tail marker and apply"""
+        self.tail_collection.set_alpha(
+            np.repeat(self._alpha_markers, self.tail_count - 1)
+        )
 
     def _clear_all(self, key):
         """
@@ -395,14 +760,21 @@ marker, and label
         """
         updated = False
 
-        for url in self.state:
-            line = self.state[url]["line"]
+        highlighted = self._alpha_lines != 0
+
+        if highlighted.any():
+            updated = True
+
+            self._alpha_lines[highlighted] = 0
+            self.line_collection.set_alpha(self._alpha_lines)
+
+            self._alpha_markers[highlighted] = 0
+            self._set_marker_alphas()
 
-            if line._alpha:
-                updated = True
-                line.set_alpha(0)
-                self.state[url]["markers"].set_alpha(0)
-                self.state[url]["annotation"].set_alpha(self.text_alpha_state)
+            self._alpha_text[highlighted] = self.text_alpha_state
+
+            for j in np.flatnonzero(highlighted):
+                self.annotations[j].set_alpha(self.text_alpha_state)
 
         if self.active_date_labels:
             updated = True
@@ -411,7 +783,7 @@ marker, and label
             self.tabbable = 0
 
         if updated:
-            self.fig.canvas.draw_idle()
+            self._redraw()
 
     def _toggle_text(self, key):
         """
@@ -419,17 +791,15 @@ marker, and label
         """
         alpha = self.text_alpha if self.text_alpha_state == 0 else 0
 
-        for url in self.state:
-            annotation = self.state[url]["annotation"]
-
-            # If a text is already highlighted, skip it
-            if annotation._alpha == 1:
-                continue
+        # Texts already highlighted are left untouched
+        mask = self._alpha_text != 1
+        self._alpha_text[mask] = alpha
 
-            annotation.set_alpha(alpha)
+        for j in np.flatnonzero(mask):
+            self.annotations[j].set_alpha(alpha)
 
         self.text_alpha_state = alpha
-        self.fig.canvas.draw_idle()
+        self._redraw()
 
     def _toggle_lines(self, key):
         """
@@ -439,18 +809,14 @@ marker, and label
         # if current state of alpha is 0, set alpha to its default value, else 0
         alpha = self.line_alpha if self.line_alpha_state == 0 else 0
 
-        for url in self.state:
-            line = self.state[url]["line"]
-
-            # If a line is already highlighted, skip it
-            if line._alpha == 1:
-                continue
+        # Lines already highlighted are left untouched
+        self._alpha_lines[self._alpha_lines != 1] = alpha
 
-            line.set_alpha(alpha)
+        self.line_collection.set_alpha(self._alpha_lines)
 
         # set the new state
         self.line_alpha_state = alpha
-        self.fig.canvas.draw_idle()
+        self._redraw()
 
     def _toggle_help(self, key):
         """
@@ -468,12 +834,13 @@ marker, and label
                 transform=self.axs.transAxes,  # relative to plot area
                 bbox=dict(boxstyle="round,pad=1", facecolor="white"),
                 va="center",
+                animated=True,
             )
         else:
             self.help_plt.remove()
             self.help_plt = None
 
-        self.fig.canvas.draw_idle()
+        self._redraw()
 
     def _cycle_dates(self, key):
         """
@@ -485,30 +852,60 @@ marker, and label
 
         step = -1 if key == "left" else 1
 
-        for url in self.state:
-            # Check if the line is visible
-            if self.state[url]["line"]._alpha == 1:
-                length = len(self.state[url]["dates"])
+        # Only cycle dates on highlighted tail lines
+        for j in np.flatnonzero(self._alpha_lines == 1):
+            dates = self._get_date_labels(j)
 
-                # tabindex always starts at 0
-                date_label = self.state[url]["dates"][self.tabindex]
+            length = len(dates)
 
-                if date_label._alpha == 0:
-                    # On first label, if date_label is hidden, make it visible
-                    date_label.set_alpha(1)
-                    date_label.set_backgroundcolor("white")
-                else:
-                    # on subsequent labels, first hide all date labels
-                    # cycle to next or previous label and set visibility
-                    self._clear_active_date_labels()
-                    self.tabindex = (self.tabindex + step) % length
-                    self.state[url]["dates"][self.tabindex].set_alpha(1)
-                    self.state[url]["dates"][self.tabindex].set_backgroundcolor("white")
+            # tabindex always starts at 0
+            date_label = dates[self.tabindex]
+
+            if date_label not in self.active_date_labels:
+                # On first label, if date_label is hidden, make it visible
+                date_label.set_alpha(1)
+                date_label.set_backgroundcolor("white")
+            else:
+                # on subsequent labels, first hide all date labels
+                # cycle to next or previous label and set visibility
+                self._clear_active_date_labels()
+                self.tabindex = (self.tabindex + step) % length
+                dates[self.tabindex].set_alpha(1)
+                dates[self.tabindex].set_backgroundcolor("white")
 
-                # track the visible labels, so we can clear them as needed
-                self.active_date_labels.append(self.state[url]["dates"][self.tabindex])
+            # track the visible labels, so we can clear them as needed
+            self.active_date_labels.append(dates[self.tabindex])
 
-        self.fig.canvas.draw_idle()
+        self._redraw()
+
+    def _get_date_labels(self, j: int) -> tuple:
+        """
+        Return the date label artists for the ticker at index `j`,
+        creating them on first use.
+
+        Head marker date text is set to bold.
+        """
+        if self.dates[j] is None:
+            dates_data = self.dates_data[j]
+
+            last = len(dates_data) - 1
+
+            self.dates[j] = tuple(
+                self.axs.annotate(
+                    date_str,
+                    xy=(x, y),
+                    xytext=(-5, -3),
+                    textcoords="offset points",
+                    horizontalalignment="right",
+                    alpha=0,
+                    zorder=100,
+                    fontweight=("bold" if k == last else "normal"),
+                    animated=True,
+                )
+                for k, (date_str, x, y) in enumerate(dates_data)
+            )
+
+        return self.dates[j]
 
     def _clear_active_date_labels(self):
         """Hide all date labels"""
@@ -523,13 +920,13 @@ marker, and label
 
         Toggle visibility of line, markers and text annotations.
         """
-        marker = event.artist
+        if event.artist is not self.head_collection:
+            return
 
-        url = marker.get_url()
+        # Index of the picked head marker within the collections
+        j = event.ind[0]
 
-        line = self.state[url]["line"]
-        markers = self.state[url]["markers"]
-        annotation = self.state[url]["annotation"]
+        annotation = self.annotations[j]
 
         # Reset the tabindex and hide any date labels
         self.tabindex = 0
@@ -538,12 +935,12 @@ marker, and label
             self._clear_active_date_labels()
 
         # toggle visibility of tail markers
-        if markers._alpha == 0:
-            markers.set_alpha(1)
+        if self._alpha_markers[j] == 0:
+            self._alpha_markers[j] = 1
             self.highlighted_count += 1
             self.tabbable = True
         else:
-            markers.set_alpha(0)
+            self._alpha_markers[j] = 0
             self.highlighted_count -= 1
 
             if self.highlighted_count == 0:
@@ -553,20 +950,27 @@ marker, and label
         if self.line_alpha_state == self.line_alpha:
             # If lines are visible, set the alpha to 1,
             # else set to default visibility.
-            line.set_alpha(line._alpha == self.line_alpha or self.line_alpha)
+            self._alpha_lines[j] = (
+                self._alpha_lines[j] == self.line_alpha or self.line_alpha
+            )
         else:
-            line.set_alpha(line._alpha == 0 or 0)
+            self._alpha_lines[j] = self._alpha_lines[j] == 0 or 0
 
         if self.text_alpha_state == self.text_alpha:
             # If text labels are visible, set the alpha to 1,
             # else set to default visibility
-            annotation.set_alpha(
-                annotation._alpha == self.text_alpha or self.text_alpha
+            self._alpha_text[j] = (
+                self._alpha_text[j] == self.text_alpha or self.text_alpha
             )
         else:
-            annotation.set_alpha(annotation._alpha == 0 or 0)
+            self._alpha_text[j] = self._alpha_text[j] == 0 or 0
+
+        annotation.set_alpha(self._alpha_text[j])
+
+        self._set_marker_alphas()
+        self.line_collection.set_alpha(self._alpha_lines)
 
-        self.fig.canvas.draw_idle()
+        self._redraw()
 
     def _on_key_press(self, event):
         """
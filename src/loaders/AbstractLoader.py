@@ -48,6 +48,18 @@ class AbstractLoader(ABC):
         """
         pass
 
+    def get_many(self, symbols: list) -> dict:
+        """Returns OHLC data for several symbols as a dict of DataFrames
+        keyed by symbol.
+
+        Loaders may override this with a batched or parallel
+        implementation. The default fetches one symbol at a time.
+
+        :param symbols: List of instrument symbols
+        :type symbols: list
+        """
+        return {symbol: self.get(symbol) for symbol in symbols}
+
     @abstractmethod
     def close(self):
         """Close pending database connections, network sessions or
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
@@ -124,6 +125,13 @@ class EODFileLoader(AbstractLoader):
 
         return df
 
+    def get_many(self, symbols: list) -> dict:
+        """Load several symbols concurrently. Each symbol is one file
+        read, so threads overlap the I/O."""
+
+        with ThreadPoolExecutor() as executor:
+            return dict(zip(symbols, executor.map(self.get, symbols)))
+
     def process_monthly(self, file, end_date) -> pd.DataFrame:
         df = pd.read_csv(
             file,